@@ -2,24 +2,90 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
 import csv
+import locale
 import os
 from datetime import datetime
 
 # --- CORE NUMPY CALCULATION (Testable Logic) ---
 
-def calculate_total_volume(workout_array):
+# Importing Numba (~170 ms) and JIT-compiling the kernel (~1 s on a cold
+# cache) only pays off for very large logs; smaller ones use NumPy.
+NUMBA_MIN_ROWS = 1_000_000
+
+_jit_metrics_kernel = None
+
+
+def _numpy_metrics_kernel(sets, reps, weight):
+    set_reps = sets.astype(np.int64) * reps
+    return (np.sum(set_reps * weight.astype(np.float64)), set_reps.sum(),
+            weight.max(initial=0.0), sets.shape[0])
+
+
+def _get_jit_metrics_kernel():
+    """
+    Imports Numba and compiles the fused metrics loop on first use.
+    Returns None if Numba (an optional dependency) is not installed.
+    """
+    global _jit_metrics_kernel
+    if _jit_metrics_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _jit_metrics_kernel = False
+            return None
+
+        @numba.njit(fastmath=True, parallel=True, cache=True)
+        def metrics_loop(sets, reps, weight):
+            # Single fused pass computing every summary metric; no temporaries.
+            # Promote the uint8 counts and float32 weight so the multiply cannot
+            # overflow and matches the float64 NumPy path and running totals.
+            volume = 0.0
+            total_reps = 0
+            max_weight = 0.0
+            for i in numba.prange(sets.shape[0]):
+                set_reps = np.int64(sets[i]) * np.int64(reps[i])
+                total_reps += set_reps
+                volume += np.float64(set_reps) * np.float64(weight[i])
+                max_weight = max(max_weight, weight[i])
+            return volume, total_reps, max_weight, sets.shape[0]
+
+        _jit_metrics_kernel = metrics_loop
+    return _jit_metrics_kernel or None
+
+
+def calculate_workout_metrics(columns):
+    """
+    Computes (total volume, total reps, heaviest weight, set count) in one
+    pass over the numeric columns (Numba-compiled for logs of at least
+    NUMBA_MIN_ROWS when Numba is installed, vectorized NumPy otherwise).
+    `columns` is either a dict mapping each field name to a 1-D array or a
+    legacy structured array with 'sets', 'reps' and 'weight' fields.
+    """
+    if len(columns['sets']) == 0:
+        return 0.0, 0, 0.0, 0
+    # Field views of a structured array are strided; hand the kernel packed
+    # homogeneous arrays. For the app's own column buffers this is a no-op.
+    sets, reps, weight = (np.ascontiguousarray(columns[name]) for name in ('sets', 'reps', 'weight'))
+    kernel = _numpy_metrics_kernel
+    if len(sets) >= NUMBA_MIN_ROWS:
+        kernel = _get_jit_metrics_kernel() or _numpy_metrics_kernel
+    volume, total_reps, max_weight, n = kernel(sets, reps, weight)
+    return float(volume), int(total_reps), float(max_weight), int(n)
+
+
+def calculate_total_volume(columns):
     """
-    Calculates the total weight lifted using NumPy's vectorized operations.
+    Calculates the total weight lifted.
     Formula: SUM(Sets * Reps * Weight)
     """
-    if workout_array.size == 0:
-        return 0.0
-    return np.sum(workout_array['sets'] * workout_array['reps'] * workout_array['weight'])
+    return calculate_workout_metrics(columns)[0]
 
 # --- TKINTER APPLICATION CLASS ---
 
 class FitnessTrackerApp(tk.Tk):
     EMBEDDED_DARK_GIF_DATA = "R0lGODlhAQABAIAAAOjo6AAAACwAAAAAAQABAAACAkQBADs="
+    INITIAL_CAPACITY = 64
+    MAX_COUNT = 255  # largest sets/reps value the uint8 columns can hold
 
     def __init__(self, log_path="workout_log.csv", image_path="gym_background.gif"):
         super().__init__()
@@ -45,11 +111,22 @@ class FitnessTrackerApp(tk.Tk):
         self._setup_canvas_and_main_frame()
 
         # Load data
-        self.session_log = self._load_data()
+        self._load_data()
+        # Running summary metrics, adjusted by each add/update/delete instead of re-reduced.
+        self._resync_metrics()
 
         # Selection
         self.selected_index = None
 
+        # Treeview iids are stable (never reused); _row_iids maps array index -> iid
+        # and _iid_to_idx is its inverse for O(1) selection lookups.
+        self._row_iids = []
+        self._iid_to_idx = {}
+        self._next_iid = 0
+
+        # Summary refreshes are coalesced into one per idle tick (see request_refresh).
+        self._refresh_pending = False
+
         # Build UI
         self._build_header()
         self._build_summary_frame()
@@ -137,26 +214,134 @@ class FitnessTrackerApp(tk.Tk):
         self._fonts = {"base": base_font, "bold": base_font_bold}
 
     def _setup_data_structure(self):
-        self.DTYPE = np.dtype([
-            ('date', 'U10'), ('exercise', 'U30'), ('sets', 'i4'),
-            ('reps', 'i4'), ('weight', 'f4')
-        ])
+        # One contiguous array per field (struct-of-arrays) so the volume
+        # reduction streams only the numeric columns. Sets/reps are uint8
+        # (capped at MAX_COUNT) to keep those streams narrow, unless a loaded
+        # log needs wider counts (see _widen_count_columns).
+        self.COLUMN_DTYPES = {
+            'date': 'U10', 'exercise': 'U30', 'sets': 'u1',
+            'reps': 'u1', 'weight': 'f4'
+        }
+        # Columns are preallocated buffers; only the first `_len` slots hold rows.
+        self._len = 0
+        self.columns = {
+            name: np.empty(self.INITIAL_CAPACITY, dtype=dt) for name, dt in self.COLUMN_DTYPES.items()
+        }
+        self._bind_row_writer()
+
+    @property
+    def session_log(self):
+        """Views of the populated part of each column buffer."""
+        return {name: col[:self._len] for name, col in self.columns.items()}
+
+    def _reserve(self, n):
+        """Grows every column buffer geometrically until it can hold `n` rows."""
+        capacity = len(self.columns['sets'])
+        if n <= capacity:
+            return
+        while capacity < n:
+            capacity *= 2
+        for name, col in self.columns.items():
+            grown = np.empty(capacity, dtype=col.dtype)
+            grown[:self._len] = col[:self._len]
+            self.columns[name] = grown
+        self._bind_row_writer()
+
+    def _bind_row_writer(self):
+        """
+        Builds `_write_row(idx, date, exercise, sets, reps, weight)` with each
+        column's __setitem__ bound up front, so storing a row is five direct
+        calls with no dict lookups. Rebound whenever the buffers are reallocated.
+        """
+        set_date, set_exercise, set_sets, set_reps, set_weight = (
+            self.columns[name].__setitem__ for name in ('date', 'exercise', 'sets', 'reps', 'weight')
+        )
+
+        def write_row(idx, date, exercise, sets, reps, weight):
+            set_date(idx, date)
+            set_exercise(idx, exercise)
+            set_sets(idx, sets)
+            set_reps(idx, reps)
+            set_weight(idx, weight)
+
+        self._write_row = write_row
+
+    def _widen_count_columns(self):
+        """Switches sets/reps to int32 for logs whose counts do not fit uint8."""
+        for name in ('sets', 'reps'):
+            self.COLUMN_DTYPES[name] = 'i4'
+            self.columns[name] = self.columns[name].astype('i4')
+        self._bind_row_writer()
+
+    def _row(self, idx):
+        return {name: col[idx] for name, col in self.columns.items()}
+
+    def _apply_row_metrics(self, idx, sign):
+        """Adds (sign=1) or removes (sign=-1) row `idx` from the running summary metrics."""
+        cols = self.columns
+        set_reps = int(cols['sets'][idx]) * int(cols['reps'][idx])
+        weight = float(cols['weight'][idx])
+        self._total_volume += sign * set_reps * weight
+        self._total_reps += sign * set_reps
+        if sign > 0:
+            self._max_weight = max(self._max_weight, weight)
+        elif weight >= self._max_weight:
+            # Removing the heaviest set needs a rescan to find the new maximum.
+            self._max_weight_stale = True
+
+    def _resync_metrics(self):
+        self._total_volume, self._total_reps, self._max_weight, _ = calculate_workout_metrics(self.session_log)
+        self._max_weight_stale = False
 
     def _load_data(self):
+        self._len = 0
+        # Formatted Treeview values per row, kept in step with the columns so
+        # a full redraw never has to re-format.
+        self._display_rows = []
+        # Set when the file exists but cannot be read; _save_data then refuses
+        # to overwrite it with the (empty) in-memory log.
+        self._load_failed = False
         if not os.path.exists(self.log_path):
-            return np.empty(0, dtype=self.DTYPE)
-        data_list = []
+            return
         try:
-            with open(self.log_path, mode='r', newline='') as file:
-                reader = csv.reader(file)
-                next(reader, None)
-                for row in reader:
-                    if len(row) == 5:
-                        data_list.append((row[0], row[1], int(row[2]), int(row[3]), float(row[4])))
-            return np.array(data_list, dtype=self.DTYPE)
+            try:
+                data_lists = self._read_log_columns('utf-8')
+            except UnicodeDecodeError:
+                # Logs saved before saves were pinned to utf-8 use the locale
+                # encoding (cp1252 on Windows).
+                data_lists = self._read_log_columns(locale.getpreferredencoding(False))
+            # Logs written with the older int32 columns may hold counts that do
+            # not fit uint8; widen the count columns rather than drop any row.
+            counts = np.array(data_lists['sets'] + data_lists['reps'], dtype=np.int64)
+            if counts.size and (counts.min() < 0 or counts.max() > self.MAX_COUNT):
+                self._widen_count_columns()
+            n = len(data_lists['sets'])
+            self._reserve(n)
+            for name, col in self.columns.items():
+                col[:n] = np.array(data_lists[name], dtype=col.dtype)
+            self._len = n
+            self._display_rows = self._format_display_rows()
         except Exception as e:
             messagebox.showerror("Data Load Error", f"Failed to load data: {e}. Starting with an empty log.")
-            return np.empty(0, dtype=self.DTYPE)
+            self._len = 0
+            self._load_failed = True
+
+    def _read_log_columns(self, encoding):
+        """Reads the CSV log into one Python list per column."""
+        data_lists = {name: [] for name in self.COLUMN_DTYPES}
+        # csv.reader handles the quoting csv.writer applies on save; each
+        # field goes straight into its column list.
+        with open(self.log_path, mode='r', newline='', encoding=encoding) as file:
+            reader = csv.reader(file)
+            next(reader, None)
+            for row in reader:
+                if len(row) == 5:
+                    data_lists['date'].append(row[0])
+                    data_lists['exercise'].append(row[1])
+                    data_lists['sets'].append(int(row[2]))
+                    data_lists['reps'].append(int(row[3]))
+                    data_lists['weight'].append(float(row[4]))
+        return data_lists
 
     def on_closing(self):
         if messagebox.askyesno(
@@ -167,13 +352,23 @@ class FitnessTrackerApp(tk.Tk):
             self.destroy()
 
     def _save_data(self):
+        if self._load_failed:
+            messagebox.showerror(
+                "Data Save Error",
+                f"'{self.log_path}' could not be loaded, so it was not overwritten. "
+                "Fix or move the file and restart to keep new sets."
+            )
+            return
         try:
-            data_to_write = self.session_log.tolist()
-            with open(self.log_path, mode='w', newline='') as file:
+            cols = self.session_log
+            # Format the weight column in one vectorized pass instead of per row.
+            weight_str = np.char.mod('%.2f', cols['weight'])
+            data_to_write = zip(cols['date'].tolist(), cols['exercise'].tolist(),
+                                cols['sets'].tolist(), cols['reps'].tolist(), weight_str.tolist())
+            with open(self.log_path, mode='w', newline='', encoding='utf-8', buffering=1 << 20) as file:
                 writer = csv.writer(file)
                 writer.writerow(['date', 'exercise', 'sets', 'reps', 'weight'])
-                for row in data_to_write:
-                    writer.writerow([row[0], row[1], row[2], row[3], f"{row[4]:.2f}"])
+                writer.writerows(data_to_write)
         except Exception as e:
             messagebox.showerror("Data Save Error", f"Failed to save data: {e}")
 
@@ -208,6 +403,16 @@ class FitnessTrackerApp(tk.Tk):
                                   font=self._fonts["bold"], foreground='#e5c07b')
         entries_label.grid(row=0, column=1, padx=6, sticky='e')
 
+        self.reps_var = tk.StringVar(value="Total Reps: 0")
+        reps_label = ttk.Label(summary_frame, textvariable=self.reps_var,
+                               font=self._fonts["bold"], foreground='#61afef')
+        reps_label.grid(row=1, column=0, padx=6, sticky='w')
+
+        self.max_weight_var = tk.StringVar(value="Heaviest Set: 0.00 kg")
+        max_weight_label = ttk.Label(summary_frame, textvariable=self.max_weight_var,
+                                     font=self._fonts["bold"], foreground='#c678dd')
+        max_weight_label.grid(row=1, column=1, padx=6, sticky='e')
+
     def _build_input_frame(self):
         input_frame = ttk.LabelFrame(self.main_frame, text="Log New Workout Set", padding="10", style='TFrame')
         input_frame.grid(row=2, column=0, sticky="ew", padx=16, pady=6)
@@ -228,6 +433,8 @@ class FitnessTrackerApp(tk.Tk):
                 self.entries[key] = entry
 
         self.entries['date'].insert(0, current_date)
+        # Fixed read order for _read_inputs: date, exercise, sets, reps, weight.
+        self._entry_widgets = tuple(self.entries[key] for key in ('date', 'exercise', 'sets', 'reps', 'weight (kg)'))
 
         # Buttons in two rows to avoid overflow on smaller widths
         button_frame_top = ttk.Frame(input_frame, style='TFrame')
@@ -272,9 +479,9 @@ class FitnessTrackerApp(tk.Tk):
             self.log_tree.heading(col, text=col)
             self.log_tree.column(col, anchor='center', minwidth=70, width=widths[col], stretch=True)
 
-        vsb = ttk.Scrollbar(log_frame, orient="vertical", command=self.log_tree.yview)
-        vsb.grid(row=0, column=1, sticky='ns')
-        self.log_tree.configure(yscrollcommand=vsb.set)
+        self._log_vsb = ttk.Scrollbar(log_frame, orient="vertical", command=self.log_tree.yview)
+        self._log_vsb.grid(row=0, column=1, sticky='ns')
+        self.log_tree.configure(yscrollcommand=self._log_vsb.set)
         self.log_tree.grid(row=0, column=0, sticky="nsew")
 
         self.log_tree.bind("<<TreeviewSelect>>", self._on_row_select)
@@ -282,25 +489,23 @@ class FitnessTrackerApp(tk.Tk):
     # --- LOGIC & UPDATE FUNCTIONS ---
 
     def add_workout_entry(self):
-        raw_data = {key: self.entries[key].get().strip() for key in self.entries}
         try:
-            sets = int(raw_data['sets'])
-            reps = int(raw_data['reps'])
-            weight = float(raw_data['weight (kg)'])
-            exercise = raw_data['exercise']
-            date = raw_data['date']
+            date, exercise, sets, reps, weight = self._read_inputs()
 
-            if sets <= 0 or reps <= 0 or weight < 0 or not exercise:
-                raise ValueError("Sets and Reps must be greater than 0. Weight must be 0 or positive. Exercise name is required.")
-
-            new_entry = np.array([(date, exercise, sets, reps, weight)], dtype=self.DTYPE)
-            self.session_log = np.concatenate([self.session_log, new_entry])
+            self._reserve(self._len + 1)
+            self._write_row(self._len, date, exercise, sets, reps, weight)
+            self._apply_row_metrics(self._len, 1)
+            self._len += 1
 
             self._clear_inputs()
-            self.update_all_displays(scroll_to_end=True)
+            display_row = self._display_row(self._len - 1)
+            self._display_rows.append(display_row)
+            iid = self._append_row_to_tree(self._len - 1, display_row)
+            self.log_tree.see(iid)
+            self.request_refresh()
 
             messagebox.showinfo("Set Added Successfully",
-                                f"New set for '{exercise}' added and tracked! Total Sets: {self.session_log.size}")
+                                f"New set for '{exercise}' added and tracked! Total Sets: {self._len}")
 
         except ValueError as e:
             messagebox.showerror(
@@ -308,34 +513,109 @@ class FitnessTrackerApp(tk.Tk):
                 f"Please check all input fields. Sets, Reps, and Weight must be numbers, and no field can be left empty. Details: {e}"
             )
 
+    def _read_inputs(self):
+        """
+        Reads and validates the input fields in a single sweep.
+        Returns (date, exercise, sets, reps, weight); raises ValueError on bad input.
+        """
+        date, exercise, sets, reps, weight = (entry.get().strip() for entry in self._entry_widgets)
+        # Digit checks reject bad counts up front instead of via int()'s exception path.
+        if not (sets.isdecimal() and reps.isdecimal() and exercise):
+            raise ValueError("Sets and Reps must be whole numbers greater than 0. Exercise name is required.")
+        sets, reps, weight = int(sets), int(reps), float(weight)
+        if sets == 0 or reps == 0 or weight < 0:
+            raise ValueError("Sets and Reps must be greater than 0. Weight must be 0 or positive.")
+        max_count = np.iinfo(self.columns['sets'].dtype).max
+        if sets > max_count or reps > max_count:
+            raise ValueError(f"Sets and Reps cannot exceed {max_count}.")
+        return date, exercise, sets, reps, weight
+
     def _clear_inputs(self):
         for key, entry in self.entries.items():
             if key not in ['date']:
                 entry.delete(0, tk.END)
 
+    def request_refresh(self):
+        """Schedules one summary refresh for the next idle tick, dropping duplicates."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._flush_refresh)
+
+    def _flush_refresh(self):
+        self._refresh_pending = False
+        self._update_summary_metrics()
+
     def update_all_displays(self, scroll_to_end=False):
         self._update_log_display(scroll_to_end)
         self._update_summary_metrics()
 
     def _update_log_display(self, scroll_to_end=False):
-        for item in self.log_tree.get_children():
-            self.log_tree.delete(item)
-
-        for idx, row in enumerate(self.session_log):
-            display_row = (row['date'], row['exercise'], str(row['sets']), str(row['reps']), f"{row['weight']:.2f}")
-            self.log_tree.insert('', 'end', iid=str(idx), values=display_row)
-
-        if scroll_to_end and self.session_log.size > 0:
-            last_item = self.log_tree.get_children()[-1]
-            self.log_tree.see(last_item)
+        """Full rebuild of the history table; mutations use the per-row helpers below."""
+        # Batch mutation: unmap the tree and stop scrollbar syncing while rows
+        # are inserted, so Tk lays out and redraws once instead of per row.
+        self.log_tree.grid_remove()
+        self.log_tree.configure(yscrollcommand='')
+
+        if self._row_iids:
+            self.log_tree.delete(*self._row_iids)
+        self._row_iids = []
+        self._iid_to_idx = {}
+
+        for idx, display_row in enumerate(self._display_rows):
+            self._append_row_to_tree(idx, display_row)
+
+        self.log_tree.configure(yscrollcommand=self._log_vsb.set)
+        self.log_tree.grid()
+
+        if scroll_to_end and self._row_iids:
+            self.log_tree.see(self._row_iids[-1])
+
+    def _format_display_rows(self):
+        """Formats every row at once with NumPy string ops instead of per-row f-strings."""
+        cols = self.session_log
+        return list(zip(
+            cols['date'].tolist(), cols['exercise'].tolist(),
+            cols['sets'].astype(str).tolist(), cols['reps'].astype(str).tolist(),
+            np.char.mod('%.2f', cols['weight']).tolist()
+        ))
+
+    def _display_row(self, idx):
+        cols = self.columns
+        return (cols['date'][idx], cols['exercise'][idx], str(cols['sets'][idx]),
+                str(cols['reps'][idx]), f"{cols['weight'][idx]:.2f}")
+
+    def _append_row_to_tree(self, idx, row):
+        iid = str(self._next_iid)
+        self._next_iid += 1
+        self._row_iids.append(iid)
+        self._iid_to_idx[iid] = idx
+        self.log_tree.insert('', 'end', iid=iid, values=row)
+        return iid
+
+    def _update_row_in_tree(self, idx, row):
+        self.log_tree.item(self._row_iids[idx], values=row)
+
+    def _remove_row_from_tree(self, idx):
+        iid = self._row_iids.pop(idx)
+        del self._iid_to_idx[iid]
+        # Rows after the deleted one moved up by one in the columns.
+        for later_iid in self._row_iids[idx:]:
+            self._iid_to_idx[later_iid] -= 1
+        self.log_tree.delete(iid)
 
     def _update_summary_metrics(self):
-        total_volume = calculate_total_volume(self.session_log)
-        total_sets = self.session_log.size
-        self.volume_var.set(f"Total Volume: {total_volume:,.2f} kg")
+        if self._max_weight_stale:
+            self._resync_metrics()
+        total_sets = self._len
+        self.volume_var.set(f"Total Volume: {self._total_volume:,.2f} kg")
         self.entries_var.set(f"Total Sets Logged: {total_sets}")
+        self.reps_var.set(f"Total Reps: {self._total_reps:,}")
+        self.max_weight_var.set(f"Heaviest Set: {self._max_weight:,.2f} kg")
 
     def analyze_performance(self):
+        # Full recompute re-syncs the running metrics against accumulated drift.
+        self._resync_metrics()
         self._update_summary_metrics()
         messagebox.showinfo("Analysis Complete", "Performance Summary has been successfully updated.")
 
@@ -349,12 +629,11 @@ class FitnessTrackerApp(tk.Tk):
                 b.state(['disabled'])
             return
 
-        try:
-            self.selected_index = int(selection[0])
+        self.selected_index = self._iid_to_idx.get(selection[0])
+        if self.selected_index is not None:
             for b in (self.load_btn, self.update_btn, self.delete_btn):
                 b.state(['!disabled'])
-        except ValueError:
-            self.selected_index = None
+        else:
             for b in (self.load_btn, self.update_btn, self.delete_btn):
                 b.state(['disabled'])
 
@@ -362,7 +641,7 @@ class FitnessTrackerApp(tk.Tk):
         if self.selected_index is None:
             messagebox.showwarning("No Selection", "Please select a row in the history table first.")
             return
-        row = self.session_log[self.selected_index]
+        row = self._row(self.selected_index)
         self.entries['date'].delete(0, tk.END)
         self.entries['date'].insert(0, row['date'])
         self.entries['exercise'].delete(0, tk.END)
@@ -379,19 +658,16 @@ class FitnessTrackerApp(tk.Tk):
             messagebox.showwarning("No Selection", "Please select a row to update.")
             return
 
-        raw_data = {key: self.entries[key].get().strip() for key in self.entries}
         try:
-            sets = int(raw_data['sets'])
-            reps = int(raw_data['reps'])
-            weight = float(raw_data['weight (kg)'])
-            exercise = raw_data['exercise']
-            date = raw_data['date']
-
-            if sets <= 0 or reps <= 0 or weight < 0 or not exercise:
-                raise ValueError("Sets/Reps must be > 0, weight ≥ 0, and exercise required.")
-
-            self.session_log[self.selected_index] = (date, exercise, sets, reps, weight)
-            self.update_all_displays()
+            date, exercise, sets, reps, weight = self._read_inputs()
+
+            self._apply_row_metrics(self.selected_index, -1)
+            self._write_row(self.selected_index, date, exercise, sets, reps, weight)
+            self._apply_row_metrics(self.selected_index, 1)
+            display_row = self._display_row(self.selected_index)
+            self._display_rows[self.selected_index] = display_row
+            self._update_row_in_tree(self.selected_index, display_row)
+            self.request_refresh()
             messagebox.showinfo("Updated", "The selected set was updated successfully.")
 
         except ValueError as e:
@@ -404,9 +680,17 @@ class FitnessTrackerApp(tk.Tk):
         if not messagebox.askyesno("Delete Set", "Are you sure you want to delete the selected set?"):
             return
         try:
-            self.session_log = np.delete(self.session_log, self.selected_index, axis=0)
+            # Shift the tail left in place (no reallocation) so rows keep
+            # their insertion order on screen and on disk.
+            idx = self.selected_index
+            self._apply_row_metrics(idx, -1)
+            for col in self.columns.values():
+                col[idx:self._len - 1] = col[idx + 1:self._len]
+            self._len -= 1
+            del self._display_rows[idx]
+            self._remove_row_from_tree(idx)
             self.selected_index = None
-            self.update_all_displays()
+            self.request_refresh()
             for b in (self.load_btn, self.update_btn, self.delete_btn):
                 b.state(['disabled'])
             messagebox.showinfo("Deleted", "The selected set was deleted.")
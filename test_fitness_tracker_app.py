@@ -0,0 +1,236 @@
+import csv
+import locale
+from tkinter import messagebox
+
+import numpy as np
+import pytest
+
+from fitness_tracker_app import FitnessTrackerApp
+
+
+def _headless_app(log_path):
+    """Builds the app's data layer (columns, load/save) without opening a Tk window."""
+    app = FitnessTrackerApp.__new__(FitnessTrackerApp)
+    app.log_path = str(log_path)
+    app._setup_data_structure()
+    app._load_data()
+    return app
+
+
+@pytest.fixture
+def dialogs(monkeypatch):
+    shown = []
+    for name in ('showerror', 'showwarning', 'showinfo'):
+        monkeypatch.setattr(messagebox, name, lambda *args, _name=name: shown.append((_name,) + args))
+    return shown
+
+
+def test_save_load_round_trip(tmp_path, dialogs):
+    rows = [
+        ('2025-01-01', 'Curl, EZ', 3, 10, 20.0),
+        ('Jan 2, 25', 'Bench "Press"', 5, 5, 82.5),
+        ('2025-01-03', 'Café Squat', 255, 1, 140.25),
+        ('2025-01-04', 'Deadlift', 1, 3, 0.0),
+    ]
+    app = _headless_app(tmp_path / 'log.csv')
+    for date, exercise, sets, reps, weight in rows:
+        app._reserve(app._len + 1)
+        app._write_row(app._len, date, exercise, sets, reps, weight)
+        app._len += 1
+    app._save_data()
+
+    loaded = _headless_app(tmp_path / 'log.csv')
+    cols = loaded.session_log
+    assert sorted(zip(*(cols[name].tolist() for name in ('date', 'exercise', 'sets', 'reps', 'weight')))) == sorted(rows)
+    assert dialogs == []
+
+
+def test_non_numeric_count_is_a_load_error(tmp_path, dialogs):
+    log = tmp_path / 'log.csv'
+    log.write_text('date,exercise,sets,reps,weight\n2025-01-01,Squat,three,5,100.00\n', encoding='utf-8')
+    app = _headless_app(log)
+    assert app._len == 0
+    assert dialogs[0][:2] == ('showerror', 'Data Load Error')
+
+
+def test_counts_above_uint8_are_kept_through_save(tmp_path, dialogs):
+    log = tmp_path / 'log.csv'
+    rows = [
+        ['2025-01-01', 'Squat', '3', '5', '100.00'],
+        ['2025-01-02', 'Jump Rope', '1', '300', '0.00'],
+        ['2025-01-03', 'Bench', '3', '6', '80.00'],
+    ]
+    with open(log, 'w', newline='', encoding='utf-8') as file:
+        csv.writer(file).writerows([['date', 'exercise', 'sets', 'reps', 'weight']] + rows)
+    app = _headless_app(log)
+    assert app.session_log['reps'].tolist() == [5, 300, 6]
+    app._save_data()
+    with open(log, newline='', encoding='utf-8') as file:
+        assert list(csv.reader(file))[1:] == rows
+    assert dialogs == []
+
+
+def test_failed_load_is_never_overwritten(tmp_path, dialogs):
+    log = tmp_path / 'log.csv'
+    original = 'date,exercise,sets,reps,weight\n2025-01-01,Squat,three,5,100.00\n'
+    log.write_text(original, encoding='utf-8')
+    app = _headless_app(log)
+    app._save_data()
+    assert log.read_text(encoding='utf-8') == original
+    assert [d[:2] for d in dialogs] == [('showerror', 'Data Load Error'), ('showerror', 'Data Save Error')]
+
+
+def test_metrics_match_running_totals_in_float64(tmp_path):
+    app = _headless_app(tmp_path / 'log.csv')
+    app._resync_metrics()
+    n = 100_000
+    app._reserve(n)
+    for idx in range(n):
+        app._write_row(idx, '2025-01-01', 'Squat', 255, 255, 333.33)
+        app._len += 1
+        app._apply_row_metrics(idx, 1)
+    running = app._total_volume
+    app._resync_metrics()
+    assert app._total_volume == pytest.approx(running, rel=1e-9)
+    assert app._total_reps == n * 255 * 255
+
+
+def test_jit_kernel_matches_numpy_kernel():
+    pytest.importorskip('numba')
+    import fitness_tracker_app as app_module
+
+    rng = np.random.default_rng(0)
+    sets = rng.integers(0, 256, 10_000).astype(np.uint8)
+    reps = rng.integers(0, 256, 10_000).astype(np.uint8)
+    weight = rng.uniform(0, 400, 10_000).astype(np.float32)
+    jit = app_module._get_jit_metrics_kernel()
+    expected = app_module._numpy_metrics_kernel(sets, reps, weight)
+    volume, total_reps, max_weight, n = jit(sets, reps, weight)
+    assert volume == pytest.approx(expected[0], rel=1e-12)
+    assert (total_reps, max_weight, n) == (expected[1], expected[2], expected[3])
+
+
+def test_locale_encoded_log_still_loads(tmp_path, dialogs, monkeypatch):
+    monkeypatch.setattr(locale, 'getpreferredencoding', lambda do_setlocale=True: 'cp1252')
+    log = tmp_path / 'log.csv'
+    log.write_bytes('date,exercise,sets,reps,weight\r\n2025-01-01,Café Squat,3,5,100.00\r\n'.encode('cp1252'))
+    app = _headless_app(log)
+    assert app.session_log['exercise'].tolist() == ['Café Squat']
+    assert dialogs == []
+
+
+class _StubTree:
+    """Records Treeview rows in order; enough of the ttk API for the log handlers."""
+
+    def __init__(self):
+        self.rows = {}
+        self._selection = ()
+
+    def insert(self, parent, index, iid, values):
+        self.rows[iid] = tuple(values)
+
+    def item(self, iid, values):
+        self.rows[iid] = tuple(values)
+
+    def delete(self, *iids):
+        for iid in iids:
+            del self.rows[iid]
+        self._selection = tuple(i for i in self._selection if i not in iids)
+
+    def see(self, iid):
+        pass
+
+    def selection(self):
+        return self._selection
+
+    def selection_set(self, iid):
+        self._selection = (iid,)
+
+    def get_children(self):
+        return tuple(self.rows)
+
+
+class _StubWidget:
+    def __init__(self):
+        self.value = ''
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+    def delete(self, first, last=None):
+        self.value = ''
+
+    def insert(self, index, value):
+        self.value = value
+
+    def state(self, flags):
+        pass
+
+
+def _headless_ui(log_path, monkeypatch):
+    """Headless app with the widgets the add/select/update/delete handlers touch stubbed out."""
+    monkeypatch.setattr(messagebox, 'askyesno', lambda *args: True)
+    app = _headless_app(log_path)
+    app._resync_metrics()
+    app.selected_index = None
+    app._row_iids, app._iid_to_idx, app._next_iid = [], {}, 0
+    app._refresh_pending = False
+    app.after_idle = lambda callback: callback()
+    app.log_tree = _StubTree()
+    app.entries = {key: _StubWidget() for key in ('date', 'exercise', 'sets', 'reps', 'weight (kg)')}
+    app._entry_widgets = tuple(app.entries[key] for key in ('date', 'exercise', 'sets', 'reps', 'weight (kg)'))
+    app.load_btn = app.update_btn = app.delete_btn = _StubWidget()
+    app.volume_var, app.entries_var, app.reps_var, app.max_weight_var = (_StubWidget() for _ in range(4))
+    return app
+
+
+def _fill_inputs(app, *values):
+    for widget, value in zip(app._entry_widgets, values):
+        widget.value = value
+
+
+def _select(app, position):
+    app.log_tree.selection_set(app.log_tree.get_children()[position])
+    app._on_row_select()
+
+
+def _assert_bookkeeping_consistent(app):
+    assert app._row_iids == list(app.log_tree.get_children())
+    assert app._iid_to_idx == {iid: idx for idx, iid in enumerate(app._row_iids)}
+    assert app._display_rows == [app.log_tree.rows[iid] for iid in app._row_iids]
+    assert [tuple(map(str, row)) for row in app._display_rows] == [
+        tuple(map(str, app._display_row(idx))) for idx in range(app._len)
+    ]
+
+
+def test_add_delete_select_update_keeps_rows_in_sync(tmp_path, dialogs, monkeypatch):
+    app = _headless_ui(tmp_path / 'log.csv', monkeypatch)
+    for exercise in ('Squat', 'Bench', 'Row', 'Press'):
+        _fill_inputs(app, '2025-01-01', exercise, '3', '5', '50')
+        app.add_workout_entry()
+    _assert_bookkeeping_consistent(app)
+
+    _select(app, 1)
+    app.delete_selected()
+    assert app.session_log['exercise'].tolist() == ['Squat', 'Row', 'Press']
+    assert app.selected_index is None
+    _assert_bookkeeping_consistent(app)
+
+    _select(app, 1)
+    assert app.selected_index == 1
+    _fill_inputs(app, '2025-01-02', 'Deadlift', '2', '4', '120')
+    app.update_selected_entry()
+    assert app.session_log['exercise'].tolist() == ['Squat', 'Deadlift', 'Press']
+    _assert_bookkeeping_consistent(app)
+
+    _select(app, 2)
+    app.delete_selected()
+    _fill_inputs(app, '2025-01-03', 'Curl', '3', '10', '15')
+    app.add_workout_entry()
+    assert app.session_log['exercise'].tolist() == ['Squat', 'Deadlift', 'Curl']
+    _assert_bookkeeping_consistent(app)
+    assert app.volume_var.value == f"Total Volume: {3 * 5 * 50 + 2 * 4 * 120 + 3 * 10 * 15:,.2f} kg"
+    assert [d[0] for d in dialogs if d[0] != 'showinfo'] == []